@@ -8,12 +8,12 @@ use shakmaty::Position;
 use std::ffi::OsStr;
 use std::path::Path;
 
-use types::{BookEntries, position_hash};
+use types::{BookEntries, position_hash, unpack_uci};
 
-/// Opening book: position hash -> list of UCI moves (duplicates = weight).
+/// Opening book: position hash -> list of packed moves (duplicates = weight).
 #[derive(Default)]
 pub struct OpeningBook {
-    /// For each position hash, one or more UCI move strings. Multiple same move = higher weight.
+    /// For each position hash, one or more packed moves. Multiple same move = higher weight.
     entries: BookEntries,
 }
 
@@ -61,8 +61,7 @@ impl OpeningBook {
             return None;
         }
         let idx = rand::random_range(0..moves.len());
-        let uci_move = moves.get(idx)?;
-        let uci: shakmaty::uci::UciMove = uci_move.parse().ok()?;
+        let uci = unpack_uci(*moves.get(idx)?);
         let mv = uci.to_move(pos).ok()?;
         if pos.is_legal(&mv) { Some(mv) } else { None }
     }
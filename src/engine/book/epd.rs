@@ -14,10 +14,16 @@ impl EpdReader {
     /// Read EPD file and populate book entries with positions.
     pub fn read(path: &Path, entries: &mut BookEntries) -> std::io::Result<()> {
         let f = File::open(path)?;
-        let reader = BufReader::new(f);
-
-        for line in reader.lines() {
-            let line = line?;
+        let mut reader = BufReader::new(f);
+
+        // Reuse one line buffer across the file; `lines()` would allocate a
+        // fresh String per line.
+        let mut line = String::new();
+        loop {
+            line.clear();
+            if reader.read_line(&mut line)? == 0 {
+                break;
+            }
             let trimmed = line.trim();
             if trimmed.is_empty() || trimmed.starts_with('#') {
                 continue;
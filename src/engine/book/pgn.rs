@@ -6,7 +6,7 @@ use std::fs::File;
 use std::io::{BufRead, BufReader};
 use std::path::Path;
 
-use super::types::{BookEntries, position_hash};
+use super::types::{BookEntries, pack_uci, position_hash};
 
 /// Reader for PGN format opening books.
 pub struct PgnReader;
@@ -15,11 +15,17 @@ impl PgnReader {
     /// Read PGN file and populate book entries.
     pub fn read(path: &Path, entries: &mut BookEntries) -> std::io::Result<()> {
         let f = File::open(path)?;
-        let reader = BufReader::new(f);
+        let mut reader = BufReader::new(f);
         let mut movetext = String::new();
 
-        for line in reader.lines() {
-            let line = line?;
+        // Reuse one line buffer across the file; `lines()` would allocate a
+        // fresh String per line.
+        let mut line = String::new();
+        loop {
+            line.clear();
+            if reader.read_line(&mut line)? == 0 {
+                break;
+            }
             let trimmed = line.trim();
             if trimmed.is_empty() {
                 if !movetext.is_empty() {
@@ -43,11 +49,12 @@ impl PgnReader {
 
     /// Parse one game's move text and add (position, move) pairs.
     fn ingest_movetext(text: &str, entries: &mut BookEntries) {
-        let tokens: Vec<&str> = text.split_whitespace().collect();
         let mut pos = Chess::default();
         let castling = CastlingMode::Standard;
 
-        for token in tokens {
+        // Stream tokens straight from the split iterator; collecting them
+        // into a Vec first cost an allocation per game.
+        for token in text.split_whitespace() {
             if token == "1-0" || token == "0-1" || token == "1/2-1/2" || token == "*" {
                 break;
             }
@@ -67,9 +74,11 @@ impl PgnReader {
                 Ok(m) => m,
                 Err(_) => break,
             };
-            let uci = mv.to_uci(castling).to_string();
+            let uci = mv.to_uci(castling);
             let key = position_hash(&pos);
-            entries.entry(key).or_default().push(uci);
+            if let Some(packed) = pack_uci(&uci) {
+                entries.entry(key).or_default().push(packed);
+            }
             pos = match pos.play(&mv) {
                 Ok(p) => p,
                 Err(_) => break,
@@ -1,7 +1,8 @@
 //! Shared types and utilities for opening book readers.
 
 use shakmaty::{
-    Chess,
+    Chess, Role, Square,
+    uci::UciMove,
     zobrist::{Zobrist64, ZobristHash},
 };
 use std::collections::HashMap;
@@ -12,5 +13,53 @@ pub fn position_hash(pos: &Chess) -> u64 {
     z.0
 }
 
-/// Book storage: position hash -> list of UCI moves (duplicates = weight).
-pub type BookEntries = HashMap<u64, Vec<String>>;
+/// Book move packed into 16 bits: `from (6) | to (6) | promotion role (3)`.
+/// Two bytes per entry instead of a heap-allocated UCI string.
+pub type PackedBookMove = u16;
+
+/// Pack a UCI move. Returns `None` for null/put moves, which never appear in
+/// book lines.
+pub fn pack_uci(uci: &UciMove) -> Option<PackedBookMove> {
+    match *uci {
+        UciMove::Normal {
+            from,
+            to,
+            promotion,
+        } => {
+            let promo = promotion.map(|r| r as u16).unwrap_or(0);
+            Some((from as u16) << 10 | (to as u16) << 4 | promo << 1)
+        }
+        _ => None,
+    }
+}
+
+/// Reverse of [`pack_uci`].
+pub fn unpack_uci(packed: PackedBookMove) -> UciMove {
+    let promo = (packed >> 1) & 0x7;
+    UciMove::Normal {
+        from: Square::new(u32::from(packed >> 10) & 0x3F),
+        to: Square::new(u32::from(packed >> 4) & 0x3F),
+        promotion: if promo == 0 {
+            None
+        } else {
+            Some(Role::ALL[promo as usize - 1])
+        },
+    }
+}
+
+/// Book storage: position hash -> list of packed moves (duplicates = weight).
+pub type BookEntries = HashMap<u64, Vec<PackedBookMove>>;
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn pack_unpack_roundtrip() {
+        for uci_str in ["e2e4", "g1f3", "e1g1", "a7a8q", "b7c8n", "h2h1r"] {
+            let uci: UciMove = uci_str.parse().unwrap();
+            let packed = pack_uci(&uci).unwrap();
+            assert_eq!(unpack_uci(packed), uci, "roundtrip failed for {uci_str}");
+        }
+    }
+}
@@ -5,7 +5,7 @@ mod material;
 mod nnue;
 
 pub use common::is_insufficient_material;
-pub use evaluator::Evaluator;
+pub use evaluator::{EvalState, Evaluator};
 pub use kind::EvalKind;
 
 /// Default evaluation with shared leaf rules (tempo, etc.).
@@ -1,12 +1,19 @@
 //! Single evaluation entry point: picks a backend and applies shared leaf rules.
 
-use shakmaty::Chess;
+use shakmaty::{Chess, Move};
 
 use super::common::finalize_leaf;
 use super::kind::EvalKind;
 use super::material;
 use super::nnue;
 
+/// Incremental evaluation state carried through a search line.
+///
+/// For the NNUE backend this holds the accumulators, updated per move by
+/// feature deltas instead of a full refresh; the material backend needs no
+/// state and evaluates from the position alone.
+pub struct EvalState(Option<nnue::Accumulator>);
+
 /// Engine evaluation harness (backend + shared material / NNUE pipeline).
 #[derive(Clone, Copy, Debug)]
 pub struct Evaluator {
@@ -36,6 +43,29 @@ impl Evaluator {
         };
         finalize_leaf(raw_stm)
     }
+
+    /// Start incremental evaluation at `pos` (one full refresh for NNUE).
+    pub fn begin(&self, pos: &Chess) -> EvalState {
+        match self.backend {
+            EvalKind::Material => EvalState(None),
+            EvalKind::Nnue => EvalState(Some(nnue::Accumulator::from_position(pos))),
+        }
+    }
+
+    /// State after playing `mv` on `pos` (position **before** the move).
+    pub fn advance(&self, state: &EvalState, pos: &Chess, mv: &Move) -> EvalState {
+        EvalState(state.0.as_ref().map(|acc| acc.play(pos, mv)))
+    }
+
+    /// As [`Self::evaluate`], but reusing incrementally maintained state.
+    pub fn evaluate_with(&self, pos: &Chess, state: &EvalState) -> i32 {
+        let raw_stm = match (self.backend, &state.0) {
+            (EvalKind::Nnue, Some(acc)) => nnue::raw_stm_nnue_with(pos, acc),
+            (EvalKind::Nnue, None) => nnue::raw_stm_nnue(pos),
+            (EvalKind::Material, _) => material::raw_stm_material(pos),
+        };
+        finalize_leaf(raw_stm)
+    }
 }
 
 impl Default for Evaluator {
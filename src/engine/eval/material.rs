@@ -1,21 +1,9 @@
 //! Classical material + mobility evaluation (centipawns, side to move).
 
-use shakmaty::{Bitboard, Chess, Color, Position, Role, Square, attacks};
+use shakmaty::{Bitboard, Chess, Color, Position, Role, attacks};
 
 use super::common::stm_from_white_pov;
 
-#[inline]
-fn piece_value(role: Role) -> i32 {
-    match role {
-        Role::Pawn => 100,
-        Role::Knight => 320,
-        Role::Bishop => 330,
-        Role::Rook => 500,
-        Role::Queen => 900,
-        Role::King => 0,
-    }
-}
-
 /// Mobility score for one side: sum of (weight × reachable squares) for each piece.
 /// Reachable squares exclude squares occupied by friendly pieces.
 fn mobility(pos: &Chess, color: Color) -> i32 {
@@ -51,13 +39,17 @@ fn mobility(pos: &Chess, color: Color) -> i32 {
 /// [`super::common::finalize_leaf`] (no tempo).
 pub(crate) fn raw_stm_material(pos: &Chess) -> i32 {
     let board = pos.board();
-    let mut white_pov = 0i32;
-    for sq in Square::ALL {
-        if let Some(piece) = board.piece_at(sq) {
-            let v = piece_value(piece.role);
-            white_pov += if piece.color == Color::White { v } else { -v };
-        }
-    }
+    let white = board.by_color(Color::White);
+    let black = board.by_color(Color::Black);
+
+    // Material as popcount differences on the piece bitboards — no per-square
+    // piece lookups. The king contributes nothing, so it is simply skipped.
+    let diff = |pieces: Bitboard| (pieces & white).count() as i32 - (pieces & black).count() as i32;
+    let mut white_pov = 100 * diff(board.pawns())
+        + 320 * diff(board.knights())
+        + 330 * diff(board.bishops())
+        + 500 * diff(board.rooks())
+        + 900 * diff(board.queens());
 
     white_pov += mobility(pos, Color::White) - mobility(pos, Color::Black);
 
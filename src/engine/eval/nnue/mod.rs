@@ -22,7 +22,7 @@
 
 mod simd;
 
-use shakmaty::{Chess, Color, Position, Role, Square};
+use shakmaty::{CastlingSide, Chess, Color, Move, Position, Role, Square};
 use std::sync::LazyLock;
 
 // ---------------------------------------------------------------------------
@@ -74,19 +74,22 @@ fn load_weights() -> NnueWeights {
 
     let mut off = 0;
 
-    // l0w stored row-major (HIDDEN_SIZE, INPUT_SIZE) — transpose for inference
-    let raw_ft = read_i16_slice(&mut off, HIDDEN_SIZE * INPUT_SIZE);
-    let ft_biases = read_i16_slice(&mut off, HIDDEN_SIZE);
-    let out_weights = read_i16_slice(&mut off, 2 * HIDDEN_SIZE);
-    let out_bias = read_i32(&mut off);
-
-    // Transpose l0w: (HIDDEN_SIZE, INPUT_SIZE) → (INPUT_SIZE, HIDDEN_SIZE)
+    // l0w is stored row-major (HIDDEN_SIZE, INPUT_SIZE); decode it straight
+    // into the transposed (INPUT_SIZE, HIDDEN_SIZE) inference layout instead
+    // of materializing the row-major copy and transposing it afterwards.
     let mut ft_weights = vec![0i16; INPUT_SIZE * HIDDEN_SIZE];
     for h in 0..HIDDEN_SIZE {
         for f in 0..INPUT_SIZE {
-            ft_weights[f * HIDDEN_SIZE + h] = raw_ft[h * INPUT_SIZE + f];
+            let src = off + (h * INPUT_SIZE + f) * 2;
+            ft_weights[f * HIDDEN_SIZE + h] =
+                i16::from_le_bytes([NET_DATA[src], NET_DATA[src + 1]]);
         }
     }
+    off += HIDDEN_SIZE * INPUT_SIZE * 2;
+
+    let ft_biases = read_i16_slice(&mut off, HIDDEN_SIZE);
+    let out_weights = read_i16_slice(&mut off, 2 * HIDDEN_SIZE);
+    let out_bias = read_i32(&mut off);
 
     NnueWeights {
         ft_weights,
@@ -97,12 +100,12 @@ fn load_weights() -> NnueWeights {
 }
 
 fn read_i16_slice(off: &mut usize, count: usize) -> Vec<i16> {
-    let mut v = Vec::with_capacity(count);
-    for _ in 0..count {
-        v.push(i16::from_le_bytes([NET_DATA[*off], NET_DATA[*off + 1]]));
-        *off += 2;
-    }
-    v
+    let start = *off;
+    *off += count * 2;
+    NET_DATA[start..*off]
+        .chunks_exact(2)
+        .map(|b| i16::from_le_bytes([b[0], b[1]]))
+        .collect()
 }
 
 fn read_i32(off: &mut usize) -> i32 {
@@ -128,20 +131,11 @@ fn read_i32(off: &mut usize) -> i32 {
 /// and the square is rank-mirrored for Black's perspective.
 #[inline]
 fn feature_index(role: Role, piece_color: Color, square: Square, perspective: Color) -> usize {
-    let sq = if perspective == Color::White {
-        square as usize
-    } else {
-        (square as usize) ^ 56
-    };
-    let piece_type = match role {
-        Role::Pawn => 0,
-        Role::Knight => 1,
-        Role::Bishop => 2,
-        Role::Rook => 3,
-        Role::Queen => 4,
-        Role::King => 5,
-    };
-    let color_offset = if piece_color == perspective { 0 } else { 384 };
+    // Branch-free: rank-mirror via XOR 56 for Black's perspective, and use the
+    // 1-based `Role` discriminant directly instead of a match.
+    let sq = (square as usize) ^ (usize::from(perspective == Color::Black) * 56);
+    let piece_type = role as usize - 1;
+    let color_offset = usize::from(piece_color != perspective) * 384;
     color_offset + piece_type * 64 + sq
 }
 
@@ -149,20 +143,125 @@ fn feature_index(role: Role, piece_color: Color, square: Square, perspective: Co
 // Accumulator
 // ---------------------------------------------------------------------------
 
-/// Full accumulator refresh from scratch for one perspective.
-fn refresh_accumulator(pos: &Chess, perspective: Color) -> Vec<i16> {
-    let w = &*WEIGHTS;
-    let mut acc = w.ft_biases.clone();
+/// Accumulators for both perspectives, stored inline so a refresh performs no
+/// heap allocation.
+#[derive(Clone)]
+pub(crate) struct Accumulator {
+    white: [i16; HIDDEN_SIZE],
+    black: [i16; HIDDEN_SIZE],
+}
 
-    for sq in Square::ALL {
-        if let Some(piece) = pos.board().piece_at(sq) {
-            let f = feature_index(piece.role, piece.color, sq, perspective);
-            let base = f * HIDDEN_SIZE;
-            simd::vec_add_i16(&mut acc, &w.ft_weights[base..base + HIDDEN_SIZE]);
+impl Accumulator {
+    /// Full refresh from scratch, filling both perspectives in one pass.
+    ///
+    /// Scans the 12 per-piece bitboards directly instead of probing all 64
+    /// squares with `piece_at`, so only occupied squares are visited — and
+    /// each piece updates the White and Black accumulators together rather
+    /// than being revisited in a second board walk.
+    pub(crate) fn from_position(pos: &Chess) -> Self {
+        let w = &*WEIGHTS;
+        let mut acc = Accumulator {
+            white: [0; HIDDEN_SIZE],
+            black: [0; HIDDEN_SIZE],
+        };
+        acc.white.copy_from_slice(&w.ft_biases);
+        acc.black.copy_from_slice(&w.ft_biases);
+
+        let board = pos.board();
+        for color in [Color::White, Color::Black] {
+            let by_color = board.by_color(color);
+            for role in Role::ALL {
+                for sq in by_color & board.by_role(role) {
+                    let fw = feature_index(role, color, sq, Color::White) * HIDDEN_SIZE;
+                    simd::vec_add_i16(&mut acc.white, &w.ft_weights[fw..fw + HIDDEN_SIZE]);
+                    let fb = feature_index(role, color, sq, Color::Black) * HIDDEN_SIZE;
+                    simd::vec_add_i16(&mut acc.black, &w.ft_weights[fb..fb + HIDDEN_SIZE]);
+                }
+            }
         }
+
+        acc
+    }
+
+    /// Activate the feature for a piece on `sq` in both perspectives.
+    fn add(&mut self, role: Role, color: Color, sq: Square) {
+        let w = &*WEIGHTS;
+        let fw = feature_index(role, color, sq, Color::White) * HIDDEN_SIZE;
+        simd::vec_add_i16(&mut self.white, &w.ft_weights[fw..fw + HIDDEN_SIZE]);
+        let fb = feature_index(role, color, sq, Color::Black) * HIDDEN_SIZE;
+        simd::vec_add_i16(&mut self.black, &w.ft_weights[fb..fb + HIDDEN_SIZE]);
     }
 
-    acc
+    /// Deactivate the feature for a piece on `sq` in both perspectives.
+    fn remove(&mut self, role: Role, color: Color, sq: Square) {
+        let w = &*WEIGHTS;
+        let fw = feature_index(role, color, sq, Color::White) * HIDDEN_SIZE;
+        simd::vec_sub_i16(&mut self.white, &w.ft_weights[fw..fw + HIDDEN_SIZE]);
+        let fb = feature_index(role, color, sq, Color::Black) * HIDDEN_SIZE;
+        simd::vec_sub_i16(&mut self.black, &w.ft_weights[fb..fb + HIDDEN_SIZE]);
+    }
+
+    /// Move a piece of `color` from `from` to `to` (changing role on
+    /// promotion): the deactivated and activated feature columns are applied
+    /// in one fused pass per perspective, halving accumulator traffic versus
+    /// a separate `remove` + `add`.
+    fn add_sub(&mut self, from_role: Role, to_role: Role, color: Color, from: Square, to: Square) {
+        let w = &*WEIGHTS;
+        let sw = feature_index(from_role, color, from, Color::White) * HIDDEN_SIZE;
+        let aw = feature_index(to_role, color, to, Color::White) * HIDDEN_SIZE;
+        simd::vec_add_sub_i16(
+            &mut self.white,
+            &w.ft_weights[aw..aw + HIDDEN_SIZE],
+            &w.ft_weights[sw..sw + HIDDEN_SIZE],
+        );
+        let sb = feature_index(from_role, color, from, Color::Black) * HIDDEN_SIZE;
+        let ab = feature_index(to_role, color, to, Color::Black) * HIDDEN_SIZE;
+        simd::vec_add_sub_i16(
+            &mut self.black,
+            &w.ft_weights[ab..ab + HIDDEN_SIZE],
+            &w.ft_weights[sb..sb + HIDDEN_SIZE],
+        );
+    }
+
+    /// Accumulator for the position reached by playing `mv` on `pos` (call
+    /// with the position **before** the move). Applies only the feature
+    /// deltas of the moved, captured, and castled pieces instead of a full
+    /// refresh — at most four add/sub column updates per perspective.
+    pub(crate) fn play(&self, pos: &Chess, mv: &Move) -> Self {
+        let mut next = self.clone();
+        let us = pos.turn();
+
+        match *mv {
+            Move::Normal {
+                role,
+                from,
+                capture,
+                to,
+                promotion,
+            } => {
+                if let Some(victim) = capture {
+                    next.remove(victim, !us, to);
+                }
+                next.add_sub(role, promotion.unwrap_or(role), us, from, to);
+            }
+            Move::EnPassant { from, to } => {
+                next.remove(Role::Pawn, !us, Square::from_coords(to.file(), from.rank()));
+                next.add_sub(Role::Pawn, Role::Pawn, us, from, to);
+            }
+            Move::Castle { king, rook } => {
+                let side = if rook > king {
+                    CastlingSide::KingSide
+                } else {
+                    CastlingSide::QueenSide
+                };
+                next.add_sub(Role::King, Role::King, us, king, side.king_to(us));
+                next.add_sub(Role::Rook, Role::Rook, us, rook, side.rook_to(us));
+            }
+            Move::Put { role, to } => next.add(role, us, to),
+        }
+
+        next
+    }
 }
 
 // ---------------------------------------------------------------------------
@@ -179,26 +278,94 @@ fn refresh_accumulator(pos: &Chess, perspective: Color) -> Vec<i16> {
 /// 4. Add output bias (scaled up by QA to match).
 /// 5. Divide by `QA² × QB` and multiply by `EVAL_SCALE`.
 pub(crate) fn raw_stm_nnue(pos: &Chess) -> i32 {
-    let white_acc = refresh_accumulator(pos, Color::White);
-    let black_acc = refresh_accumulator(pos, Color::Black);
+    raw_stm_nnue_with(pos, &Accumulator::from_position(pos))
+}
 
+/// As [`raw_stm_nnue`], but reusing an [`Accumulator`] maintained
+/// incrementally by the caller instead of refreshing from scratch.
+pub(crate) fn raw_stm_nnue_with(pos: &Chess, acc: &Accumulator) -> i32 {
     let (us_acc, them_acc) = if pos.turn() == Color::White {
-        (&white_acc, &black_acc)
+        (&acc.white, &acc.black)
     } else {
-        (&black_acc, &white_acc)
+        (&acc.black, &acc.white)
     };
 
     let w = &*WEIGHTS;
 
-    let us_dot = simd::screlu_dot(us_acc, &w.out_weights[..HIDDEN_SIZE]);
-    let them_dot = simd::screlu_dot(them_acc, &w.out_weights[HIDDEN_SIZE..]);
+    let dot = simd::screlu_dot_pair(
+        us_acc,
+        &w.out_weights[..HIDDEN_SIZE],
+        them_acc,
+        &w.out_weights[HIDDEN_SIZE..],
+    );
 
-    // us_dot and them_dot are at scale QA² × QB.
+    // dot is at scale QA² × QB.
     // out_bias is at scale QA × QB — multiply by QA to match.
-    let raw = us_dot + them_dot + w.out_bias * QA as i32;
+    let raw = dot + w.out_bias * QA as i32;
 
     // Convert to centipawns: raw / (QA² × QB) × EVAL_SCALE
     // Use i64 to avoid overflow with large trained-net activations.
     let divisor = QA as i64 * QA as i64 * QB as i64;
     (raw as i64 * EVAL_SCALE as i64 / divisor) as i32
 }
+
+// ---------------------------------------------------------------------------
+// Tests
+// ---------------------------------------------------------------------------
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use shakmaty::fen::Fen;
+    use shakmaty::{CastlingMode, uci::UciMove};
+
+    fn chess(fen: &str) -> Chess {
+        let f: Fen = fen.parse().unwrap();
+        f.into_position(CastlingMode::Standard).unwrap()
+    }
+
+    /// Incremental update after `uci` must match a full refresh of the child.
+    fn assert_play_matches_refresh(pos: &Chess, uci: &str) {
+        let mv = uci
+            .parse::<UciMove>()
+            .unwrap()
+            .to_move(pos)
+            .expect("legal move");
+        let incremental = Accumulator::from_position(pos).play(pos, &mv);
+        let child = pos.clone().play(&mv).unwrap();
+        let refreshed = Accumulator::from_position(&child);
+        assert_eq!(incremental.white, refreshed.white, "white acc for {uci}");
+        assert_eq!(incremental.black, refreshed.black, "black acc for {uci}");
+    }
+
+    #[test]
+    fn play_matches_refresh_quiet_and_capture() {
+        let pos = Chess::default();
+        assert_play_matches_refresh(&pos, "e2e4");
+        let pos = chess("rnbqkbnr/ppp1pppp/8/3p4/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2");
+        assert_play_matches_refresh(&pos, "e4d5");
+    }
+
+    #[test]
+    fn play_matches_refresh_en_passant() {
+        let pos = chess("rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3");
+        assert_play_matches_refresh(&pos, "e5f6");
+    }
+
+    #[test]
+    fn play_matches_refresh_castling() {
+        let pos = chess("r3k2r/pppq1ppp/2npbn2/2b1p3/2B1P3/2NPBN2/PPPQ1PPP/R3K2R w KQkq - 0 8");
+        assert_play_matches_refresh(&pos, "e1g1");
+        assert_play_matches_refresh(&pos, "e1c1");
+        let black = chess("r3k2r/pppq1ppp/2npbn2/2b1p3/2B1P3/2NPBN2/PPPQ1PPP/R4RK1 b kq - 1 8");
+        assert_play_matches_refresh(&black, "e8g8");
+        assert_play_matches_refresh(&black, "e8c8");
+    }
+
+    #[test]
+    fn play_matches_refresh_promotion() {
+        let pos = chess("r2q1bnr/pP2kppp/4p3/8/8/8/P1PPPPPP/RNBQKBNR w KQ - 1 7");
+        assert_play_matches_refresh(&pos, "b7b8q");
+        assert_play_matches_refresh(&pos, "b7a8n");
+    }
+}
@@ -38,7 +38,6 @@ pub fn vec_add_i16(dst: &mut [i16], src: &[i16]) {
 
 /// Elementwise `dst[i] -= src[i]` for i16 slices.
 #[inline]
-#[allow(dead_code)] // prepared for future incremental accumulator updates
 pub fn vec_sub_i16(dst: &mut [i16], src: &[i16]) {
     debug_assert_eq!(dst.len(), src.len());
 
@@ -58,28 +57,58 @@ pub fn vec_sub_i16(dst: &mut [i16], src: &[i16]) {
     scalar::vec_sub(dst, src);
 }
 
-/// SCReLU dot product: `Σ clamp(acc[i], 0, QA)² × weights[i]`.
+/// Fused elementwise `dst[i] += add[i] - sub[i]` for i16 slices.
 ///
-/// The result is in quantized units at scale QA² × QB. The caller divides by
-/// `QA² × QB` (and applies `EVAL_SCALE`) to get centipawns.
+/// A moved piece deactivates one feature column and activates another; doing
+/// both in one pass reads and writes the accumulator once instead of twice.
 #[inline]
-pub fn screlu_dot(acc: &[i16], weights: &[i16]) -> i32 {
-    debug_assert_eq!(acc.len(), weights.len());
+pub fn vec_add_sub_i16(dst: &mut [i16], add: &[i16], sub: &[i16]) {
+    debug_assert_eq!(dst.len(), add.len());
+    debug_assert_eq!(dst.len(), sub.len());
 
     #[cfg(target_arch = "x86_64")]
     {
         if is_x86_feature_detected!("avx2") {
-            return unsafe { avx2::screlu_dot(acc, weights) };
+            return unsafe { avx2::vec_add_sub(dst, add, sub) };
         }
     }
 
     #[cfg(target_arch = "aarch64")]
     {
-        return unsafe { neon::screlu_dot(acc, weights) };
+        return unsafe { neon::vec_add_sub(dst, add, sub) };
     }
 
     #[allow(unreachable_code)]
-    scalar::screlu_dot(acc, weights)
+    scalar::vec_add_sub(dst, add, sub);
+}
+
+/// Fused SCReLU dot product over both perspectives:
+/// `Σ clamp(us[i], 0, QA)² × us_w[i] + Σ clamp(them[i], 0, QA)² × them_w[i]`.
+///
+/// Both halves of the output layer accumulate into the same vector sum with a
+/// single horizontal reduction at the end, instead of two separate dot-product
+/// passes. The result is in quantized units at scale QA² × QB; the caller
+/// divides by `QA² × QB` (and applies `EVAL_SCALE`) to get centipawns.
+#[inline]
+pub fn screlu_dot_pair(us: &[i16], us_w: &[i16], them: &[i16], them_w: &[i16]) -> i32 {
+    debug_assert_eq!(us.len(), us_w.len());
+    debug_assert_eq!(them.len(), them_w.len());
+    debug_assert_eq!(us.len(), them.len());
+
+    #[cfg(target_arch = "x86_64")]
+    {
+        if is_x86_feature_detected!("avx2") {
+            return unsafe { avx2::screlu_dot_pair(us, us_w, them, them_w) };
+        }
+    }
+
+    #[cfg(target_arch = "aarch64")]
+    {
+        return unsafe { neon::screlu_dot_pair(us, us_w, them, them_w) };
+    }
+
+    #[allow(unreachable_code)]
+    scalar::screlu_dot_pair(us, us_w, them, them_w)
 }
 
 // ---------------------------------------------------------------------------
@@ -95,13 +124,18 @@ mod scalar {
         }
     }
 
-    #[allow(dead_code)]
     pub fn vec_sub(dst: &mut [i16], src: &[i16]) {
         for (d, &s) in dst.iter_mut().zip(src) {
             *d = d.wrapping_sub(s);
         }
     }
 
+    pub fn vec_add_sub(dst: &mut [i16], add: &[i16], sub: &[i16]) {
+        for ((d, &a), &s) in dst.iter_mut().zip(add).zip(sub) {
+            *d = d.wrapping_add(a).wrapping_sub(s);
+        }
+    }
+
     pub fn screlu_dot(acc: &[i16], weights: &[i16]) -> i32 {
         let mut sum: i32 = 0;
         for (&a, &w) in acc.iter().zip(weights) {
@@ -110,6 +144,10 @@ mod scalar {
         }
         sum
     }
+
+    pub fn screlu_dot_pair(us: &[i16], us_w: &[i16], them: &[i16], them_w: &[i16]) -> i32 {
+        screlu_dot(us, us_w) + screlu_dot(them, them_w)
+    }
 }
 
 // ---------------------------------------------------------------------------
@@ -143,7 +181,6 @@ mod avx2 {
         }
     }
 
-    #[allow(dead_code)]
     #[target_feature(enable = "avx2")]
     pub unsafe fn vec_sub(dst: &mut [i16], src: &[i16]) {
         let len = dst.len();
@@ -165,13 +202,42 @@ mod avx2 {
         }
     }
 
-    /// SCReLU dot product using i32 widening (safe for arbitrary weight magnitudes).
+    #[target_feature(enable = "avx2")]
+    pub unsafe fn vec_add_sub(dst: &mut [i16], add: &[i16], sub: &[i16]) {
+        let len = dst.len();
+        let mut i = 0;
+        while i + 16 <= len {
+            unsafe {
+                let d = _mm256_loadu_si256(dst.as_ptr().add(i).cast());
+                let a = _mm256_loadu_si256(add.as_ptr().add(i).cast());
+                let s = _mm256_loadu_si256(sub.as_ptr().add(i).cast());
+                _mm256_storeu_si256(
+                    dst.as_mut_ptr().add(i).cast(),
+                    _mm256_sub_epi16(_mm256_add_epi16(d, a), s),
+                );
+            }
+            i += 16;
+        }
+        while i < len {
+            unsafe {
+                *dst.get_unchecked_mut(i) = dst
+                    .get_unchecked(i)
+                    .wrapping_add(*add.get_unchecked(i))
+                    .wrapping_sub(*sub.get_unchecked(i));
+            }
+            i += 1;
+        }
+    }
+
+    /// Fused SCReLU dot product over both perspectives using i32 widening
+    /// (safe for arbitrary weight magnitudes).
     ///
-    /// For each group of 16 i16 values, we widen clamped accumulators and weights
-    /// to i32, compute `clamped² × weight`, and accumulate.
+    /// For each group of 16 i16 values per half, we widen clamped accumulators
+    /// and weights to i32, compute `clamped² × weight`, and accumulate both
+    /// halves into one vector sum with a single horizontal reduction.
     #[target_feature(enable = "avx2")]
-    pub unsafe fn screlu_dot(acc: &[i16], weights: &[i16]) -> i32 {
-        let len = acc.len();
+    pub unsafe fn screlu_dot_pair(us: &[i16], us_w: &[i16], them: &[i16], them_w: &[i16]) -> i32 {
+        let len = us.len();
         let mut sum = _mm256_setzero_si256();
         let zero = _mm256_setzero_si256();
         let qa = _mm256_set1_epi16(QA);
@@ -179,20 +245,22 @@ mod avx2 {
         let mut i = 0;
         while i + 16 <= len {
             unsafe {
-                let a = _mm256_loadu_si256(acc.as_ptr().add(i).cast());
-                let w = _mm256_loadu_si256(weights.as_ptr().add(i).cast());
-
-                let clamped = _mm256_min_epi16(_mm256_max_epi16(a, zero), qa);
-
-                let clamp_lo = _mm256_cvtepi16_epi32(_mm256_castsi256_si128(clamped));
-                let w_lo = _mm256_cvtepi16_epi32(_mm256_castsi256_si128(w));
-                let sq_lo = _mm256_mullo_epi32(clamp_lo, clamp_lo);
-                sum = _mm256_add_epi32(sum, _mm256_mullo_epi32(sq_lo, w_lo));
-
-                let clamp_hi = _mm256_cvtepi16_epi32(_mm256_extracti128_si256(clamped, 1));
-                let w_hi = _mm256_cvtepi16_epi32(_mm256_extracti128_si256(w, 1));
-                let sq_hi = _mm256_mullo_epi32(clamp_hi, clamp_hi);
-                sum = _mm256_add_epi32(sum, _mm256_mullo_epi32(sq_hi, w_hi));
+                for (acc, weights) in [(us, us_w), (them, them_w)] {
+                    let a = _mm256_loadu_si256(acc.as_ptr().add(i).cast());
+                    let w = _mm256_loadu_si256(weights.as_ptr().add(i).cast());
+
+                    let clamped = _mm256_min_epi16(_mm256_max_epi16(a, zero), qa);
+
+                    let clamp_lo = _mm256_cvtepi16_epi32(_mm256_castsi256_si128(clamped));
+                    let w_lo = _mm256_cvtepi16_epi32(_mm256_castsi256_si128(w));
+                    let sq_lo = _mm256_mullo_epi32(clamp_lo, clamp_lo);
+                    sum = _mm256_add_epi32(sum, _mm256_mullo_epi32(sq_lo, w_lo));
+
+                    let clamp_hi = _mm256_cvtepi16_epi32(_mm256_extracti128_si256(clamped, 1));
+                    let w_hi = _mm256_cvtepi16_epi32(_mm256_extracti128_si256(w, 1));
+                    let sq_hi = _mm256_mullo_epi32(clamp_hi, clamp_hi);
+                    sum = _mm256_add_epi32(sum, _mm256_mullo_epi32(sq_hi, w_hi));
+                }
             }
 
             i += 16;
@@ -202,8 +270,10 @@ mod avx2 {
 
         while i < len {
             unsafe {
-                let c = (*acc.get_unchecked(i)).clamp(0, QA) as i32;
-                result += c * c * *weights.get_unchecked(i) as i32;
+                let c = (*us.get_unchecked(i)).clamp(0, QA) as i32;
+                result += c * c * *us_w.get_unchecked(i) as i32;
+                let c = (*them.get_unchecked(i)).clamp(0, QA) as i32;
+                result += c * c * *them_w.get_unchecked(i) as i32;
             }
             i += 1;
         }
@@ -253,7 +323,6 @@ mod neon {
         }
     }
 
-    #[allow(dead_code)]
     pub unsafe fn vec_sub(dst: &mut [i16], src: &[i16]) {
         let len = dst.len();
         let mut i = 0;
@@ -274,32 +343,59 @@ mod neon {
         }
     }
 
-    /// SCReLU dot product using i32 widening via NEON.
+    pub unsafe fn vec_add_sub(dst: &mut [i16], add: &[i16], sub: &[i16]) {
+        let len = dst.len();
+        let mut i = 0;
+        while i + 8 <= len {
+            unsafe {
+                let d = vld1q_s16(dst.as_ptr().add(i));
+                let a = vld1q_s16(add.as_ptr().add(i));
+                let s = vld1q_s16(sub.as_ptr().add(i));
+                vst1q_s16(dst.as_mut_ptr().add(i), vsubq_s16(vaddq_s16(d, a), s));
+            }
+            i += 8;
+        }
+        while i < len {
+            unsafe {
+                *dst.get_unchecked_mut(i) = dst
+                    .get_unchecked(i)
+                    .wrapping_add(*add.get_unchecked(i))
+                    .wrapping_sub(*sub.get_unchecked(i));
+            }
+            i += 1;
+        }
+    }
+
+    /// Fused SCReLU dot product over both perspectives using i32 widening via
+    /// NEON.
     ///
     /// Uses `vmovl_s16` to widen i16 → i32, then `vmulq_s32` + `vmlaq_s32`
-    /// for overflow-safe `clamped² × weight` computation.
-    pub unsafe fn screlu_dot(acc: &[i16], weights: &[i16]) -> i32 {
+    /// for overflow-safe `clamped² × weight` computation; both halves share
+    /// one vector sum and a single horizontal reduction.
+    pub unsafe fn screlu_dot_pair(us: &[i16], us_w: &[i16], them: &[i16], them_w: &[i16]) -> i32 {
         unsafe {
-            let len = acc.len();
+            let len = us.len();
             let mut sum = vdupq_n_s32(0);
             let zero = vdupq_n_s16(0);
             let qa = vdupq_n_s16(QA);
 
             let mut i = 0;
             while i + 8 <= len {
-                let a = vld1q_s16(acc.as_ptr().add(i));
-                let w = vld1q_s16(weights.as_ptr().add(i));
-                let clamped = vminq_s16(vmaxq_s16(a, zero), qa);
-
-                let clamp_lo = vmovl_s16(vget_low_s16(clamped));
-                let w_lo = vmovl_s16(vget_low_s16(w));
-                let sq_lo = vmulq_s32(clamp_lo, clamp_lo);
-                sum = vmlaq_s32(sum, sq_lo, w_lo);
-
-                let clamp_hi = vmovl_s16(vget_high_s16(clamped));
-                let w_hi = vmovl_s16(vget_high_s16(w));
-                let sq_hi = vmulq_s32(clamp_hi, clamp_hi);
-                sum = vmlaq_s32(sum, sq_hi, w_hi);
+                for (acc, weights) in [(us, us_w), (them, them_w)] {
+                    let a = vld1q_s16(acc.as_ptr().add(i));
+                    let w = vld1q_s16(weights.as_ptr().add(i));
+                    let clamped = vminq_s16(vmaxq_s16(a, zero), qa);
+
+                    let clamp_lo = vmovl_s16(vget_low_s16(clamped));
+                    let w_lo = vmovl_s16(vget_low_s16(w));
+                    let sq_lo = vmulq_s32(clamp_lo, clamp_lo);
+                    sum = vmlaq_s32(sum, sq_lo, w_lo);
+
+                    let clamp_hi = vmovl_s16(vget_high_s16(clamped));
+                    let w_hi = vmovl_s16(vget_high_s16(w));
+                    let sq_hi = vmulq_s32(clamp_hi, clamp_hi);
+                    sum = vmlaq_s32(sum, sq_hi, w_hi);
+                }
 
                 i += 8;
             }
@@ -307,8 +403,10 @@ mod neon {
             let mut result = vaddvq_s32(sum);
 
             while i < len {
-                let c = (*acc.get_unchecked(i)).clamp(0, QA) as i32;
-                result += c * c * *weights.get_unchecked(i) as i32;
+                let c = (*us.get_unchecked(i)).clamp(0, QA) as i32;
+                result += c * c * *us_w.get_unchecked(i) as i32;
+                let c = (*them.get_unchecked(i)).clamp(0, QA) as i32;
+                result += c * c * *them_w.get_unchecked(i) as i32;
                 i += 1;
             }
             result
@@ -347,17 +445,31 @@ mod tests {
     }
 
     #[test]
-    fn test_screlu_dot_basic() {
+    fn test_vec_add_sub_fused_matches_separate() {
+        let mut fused: Vec<i16> = (0..37).map(|i| i * 7 - 100).collect();
+        let mut separate = fused.clone();
+        let add: Vec<i16> = (0..37).map(|i| i * 11 - 200).collect();
+        let sub: Vec<i16> = (0..37).map(|i| 300 - i * 13).collect();
+
+        vec_add_sub_i16(&mut fused, &add, &sub);
+        vec_add_i16(&mut separate, &add);
+        vec_sub_i16(&mut separate, &sub);
+        assert_eq!(fused, separate);
+    }
+
+    #[test]
+    fn test_screlu_dot_pair_basic() {
         let acc = vec![0i16; 8];
         let weights = vec![1i16; 8];
-        assert_eq!(screlu_dot(&acc, &weights), 0);
+        assert_eq!(screlu_dot_pair(&acc, &weights, &acc, &weights), 0);
     }
 
     #[test]
-    fn test_screlu_dot_clamping() {
+    fn test_screlu_dot_pair_clamping() {
         let qa = QA;
         let acc = vec![-10i16, 0, 100, qa, qa + 50, qa, 0, 50];
         let weights = vec![1i16; 8];
+        let them = vec![0i16; 8];
 
         let expected: i32 = acc
             .iter()
@@ -368,24 +480,26 @@ mod tests {
             })
             .sum();
 
-        assert_eq!(screlu_dot(&acc, &weights), expected);
+        assert_eq!(screlu_dot_pair(&acc, &weights, &them, &weights), expected);
     }
 
     #[test]
-    fn test_screlu_dot_negative_weights() {
+    fn test_screlu_dot_pair_negative_weights() {
         let acc = vec![QA; 16];
         let weights = vec![-10i16; 16];
-        let expected = 16 * (QA as i32) * (QA as i32) * (-10i32);
-        assert_eq!(screlu_dot(&acc, &weights), expected);
+        let expected = 2 * 16 * (QA as i32) * (QA as i32) * (-10i32);
+        assert_eq!(screlu_dot_pair(&acc, &weights, &acc, &weights), expected);
     }
 
     #[test]
-    fn test_screlu_dot_matches_scalar() {
+    fn test_screlu_dot_pair_matches_scalar() {
         // Realistic ranges: acc ∈ [-380, 385], weights ∈ [-100, 100] (QB=64 scale)
-        let acc: Vec<i16> = (0..256).map(|i| (i * 3 - 380) as i16).collect();
-        let weights: Vec<i16> = (0..256).map(|i| (i % 201 - 100) as i16).collect();
+        let us: Vec<i16> = (0..256).map(|i| (i * 3 - 380) as i16).collect();
+        let us_w: Vec<i16> = (0..256).map(|i| (i % 201 - 100) as i16).collect();
+        let them: Vec<i16> = (0..256).map(|i| (385 - i * 3) as i16).collect();
+        let them_w: Vec<i16> = (0..256).map(|i| (100 - i % 201) as i16).collect();
 
-        let expected = scalar::screlu_dot(&acc, &weights);
-        assert_eq!(screlu_dot(&acc, &weights), expected);
+        let expected = scalar::screlu_dot_pair(&us, &us_w, &them, &them_w);
+        assert_eq!(screlu_dot_pair(&us, &us_w, &them, &them_w), expected);
     }
 }
@@ -71,6 +71,15 @@ fn main() {
     let batches_per_sb: usize = find_arg(&args, "--batches-per-sb")
         .and_then(|s| s.parse().ok())
         .unwrap_or(1024);
+    // Data-pipeline sizing: loader shuffle buffer and prepared-batch queue.
+    // Both exist to keep the training threads fed; raise them if the loss
+    // loop ever stalls waiting on batches.
+    let buffer_size_mb: usize = find_arg(&args, "--buffer-mb")
+        .and_then(|s| s.parse().ok())
+        .unwrap_or(512);
+    let batch_queue_size: usize = find_arg(&args, "--batch-queue")
+        .and_then(|s| s.parse().ok())
+        .unwrap_or(64);
 
     let hl_size = 256;
     let final_lr = initial_lr * 0.3f32.powi(5);
@@ -86,6 +95,9 @@ fn main() {
             SavedFormat::id("l1w").round().quantise::<i16>(64),
             SavedFormat::id("l1b").round().quantise::<i32>(255 * 64),
         ])
+        // Regularisation is AdamW's decoupled weight decay — keeping an
+        // explicit L2 term out of the loss avoids an extra parameter-sized
+        // penalty pass per batch and leaves the loss a pure sigmoid MSE.
         .loss_fn(|output, target| output.sigmoid().squared_error(target))
         .build(|builder, stm_inputs, ntm_inputs| {
             let l0 = builder.new_affine("l0", 768, hl_size);
@@ -121,7 +133,7 @@ fn main() {
         threads,
         test_set: None,
         output_directory: "checkpoints",
-        batch_queue_size: 64,
+        batch_queue_size,
     };
 
     let data_files = resolve_binpacks(&data_arg);
@@ -141,7 +153,6 @@ fn main() {
     println!("Total: {:.1} MB", total_size as f64 / 1_048_576.0);
     println!();
 
-    let buffer_size_mb = 512;
     fn filter(entry: &TrainingDataEntry) -> bool {
         entry.ply >= 16
             && !entry.pos.is_checked(entry.pos.side_to_move())
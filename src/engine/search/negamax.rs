@@ -10,7 +10,8 @@ use std::sync::atomic::Ordering;
 
 use shakmaty::{Chess, Move, Position};
 
-use crate::engine::tt::TTFlag;
+use crate::engine::eval::EvalState;
+use crate::engine::tt::{NO_MOVE, PackedTTMove, TTEntry, TTFlag};
 
 use super::pv::get_hash;
 use super::searcher::Searcher;
@@ -52,13 +53,20 @@ impl Searcher {
 
         let hash = get_hash(pos);
 
-        if let Some(tt_score) = self.probe_tt(hash, depth, alpha, beta, is_pv) {
-            return tt_score;
+        // One TT probe per node: take the cutoff and the hash move from the
+        // same entry instead of probing twice.
+        let tt_entry = self.tt.probe(hash);
+        if let Some(ref entry) = tt_entry {
+            self.stats.tt_hits += 1;
+            if let Some(tt_score) = self.tt_cutoff(entry, depth, alpha, beta, is_pv) {
+                return tt_score;
+            }
         }
-        let tt_move = self.get_tt_move(hash);
+        let tt_move = tt_entry.map_or(NO_MOVE, |e| e.best_move);
 
         if depth <= 0 {
-            return self.quiescence(pos, alpha, beta, ply);
+            let state = self.eval_begin(pos);
+            return self.quiescence(pos, alpha, beta, ply, &state, hash);
         }
 
         let (depth, in_check) = self.apply_check_extension(depth, pos);
@@ -98,21 +106,14 @@ impl Searcher {
         None
     }
 
-    fn get_tt_move(&self, hash: u64) -> Option<Move> {
-        self.tt.probe(hash).and_then(|e| e.best_move)
-    }
-
-    fn probe_tt(
+    fn tt_cutoff(
         &mut self,
-        hash: u64,
+        entry: &TTEntry,
         depth: i32,
         alpha: i32,
         beta: i32,
         is_pv: bool,
     ) -> Option<i32> {
-        let entry = self.tt.probe(hash)?;
-        self.stats.tt_hits += 1;
-
         if is_pv || entry.depth < depth as i8 {
             return None;
         }
@@ -156,23 +157,15 @@ impl Searcher {
         let null_pos = pos.clone().swap_turn().ok()?;
         let reduction = 3 + ctx.depth / 6;
 
-        let null_ctx = SearchContext {
-            depth: ctx.depth - 1 - reduction,
-            alpha: -ctx.beta,
-            beta: -ctx.beta + 1,
-            ply: ctx.ply + 1,
-            is_pv: false,
-            in_check: false,
-            hash: get_hash(&null_pos),
-        };
-
+        // The child computes its own hash; building a full SearchContext here
+        // only paid for a zobrist pass that nothing read.
         let null_score = -self.negamax(
             &null_pos,
-            null_ctx.depth,
-            null_ctx.alpha,
-            null_ctx.beta,
-            null_ctx.ply,
-            null_ctx.is_pv,
+            ctx.depth - 1 - reduction,
+            -ctx.beta,
+            -ctx.beta + 1,
+            ctx.ply + 1,
+            false,
         );
 
         if null_score >= ctx.beta {
@@ -194,11 +187,11 @@ impl Searcher {
         &mut self,
         pos: &Chess,
         legals: &shakmaty::MoveList,
-        tt_move: Option<Move>,
+        tt_move: PackedTTMove,
         mut ctx: SearchContext,
     ) -> i32 {
         let alpha0 = ctx.alpha;
-        let ordered = self.order_moves(pos, legals, tt_move.as_ref(), ctx.ply);
+        let ordered = self.order_moves(legals, tt_move, ctx.ply);
         let mut best_score = -super::types::INFINITY;
         let mut best_move: Option<Move> = None;
 
@@ -319,21 +312,43 @@ impl Searcher {
             TTFlag::Exact
         };
 
-        self.tt
-            .store(hash, best_move, depth as i8, best_score as i16, flag);
+        self.tt.store(
+            hash,
+            best_move.as_ref(),
+            depth as i8,
+            best_score as i16,
+            flag,
+        );
     }
 
     /// Quiescence: negamax on tactical moves only (captures / promotions), with standing pat.
+    ///
+    /// `state` is the incremental evaluation state for `pos`; it is advanced
+    /// by feature deltas down the capture tree instead of refreshed per node.
+    /// `hash` is the zobrist key of `pos`, already computed by the caller.
     pub(super) fn quiescence(
         &mut self,
         pos: &Chess,
         mut alpha: i32,
         beta: i32,
         _ply: usize,
+        state: &EvalState,
+        hash: u64,
     ) -> i32 {
         self.stats.qnodes += 1;
 
-        let hash = get_hash(pos);
+        // Checking the clock involves a syscall-backed Instant read, so poll it
+        // once every 1024 qnodes rather than per move like the earlier loop did.
+        // The shared counter is fed in the same batch so qsearch work shows up
+        // in node limits and nps without per-node atomic traffic.
+        if self.stats.qnodes & 0x3FF == 0 {
+            if let Some(ref gn) = self.global_nodes {
+                gn.fetch_add(1024, Ordering::Relaxed);
+            }
+            if self.should_stop() {
+                return alpha;
+            }
+        }
 
         if let Some(entry) = self.tt.probe(hash).filter(|e| e.depth >= 0) {
             match entry.flag {
@@ -344,7 +359,7 @@ impl Searcher {
             }
         }
 
-        let stand_pat = self.evaluate_position(pos);
+        let stand_pat = self.evaluate_with(pos, state);
         let alpha0 = alpha;
         let mut best_score = stand_pat;
         let mut best_move: Option<Move> = None;
@@ -358,20 +373,25 @@ impl Searcher {
             alpha = stand_pat;
         }
 
-        for mv in pos.legal_moves().iter() {
-            if self.should_stop() {
-                return best_score;
+        // Generate tactical moves directly (captures, plus quiet promotions)
+        // instead of building the full legal move list and discarding the quiets.
+        let mut tacticals = pos.capture_moves();
+        for mv in pos.promotion_moves() {
+            if !mv.is_capture() {
+                tacticals.push(mv);
             }
+        }
 
-            if !mv.is_capture() && !mv.is_promotion() {
-                continue;
-            }
+        for mv in tacticals.iter() {
             if stand_pat + 1000 < alpha && !mv.is_promotion() {
                 continue;
             }
 
+            let child_state = self.eval_advance(state, pos, mv);
             let new_pos = pos.clone().play(mv).unwrap();
-            let score = -self.quiescence(&new_pos, -beta, -alpha, _ply + 1);
+            let child_hash = get_hash(&new_pos);
+            let score =
+                -self.quiescence(&new_pos, -beta, -alpha, _ply + 1, &child_state, child_hash);
 
             if score > best_score {
                 best_score = score;
@@ -396,7 +416,7 @@ impl Searcher {
         };
         self.tt.store(
             hash,
-            best_move,
+            best_move.as_ref(),
             0,
             best_score.clamp(-32768, 32767) as i16,
             flag,
@@ -1,8 +1,9 @@
 //! Move ordering: killer moves, history heuristic, MVV-LVA.
 
-use shakmaty::{Chess, Move, MoveList, Position};
+use shakmaty::{Move, MoveList};
 
 use super::types::MAX_DEPTH;
+use crate::engine::tt::{PackedTTMove, pack_move};
 
 pub(super) struct KillerMoves {
     pub(super) moves: Vec<[Option<Move>; 2]>,
@@ -57,38 +58,39 @@ impl HistoryTable {
 }
 
 pub(super) fn order_moves(
-    pos: &Chess,
     moves: &MoveList,
-    tt_move: Option<&Move>,
+    tt_move: PackedTTMove,
     ply: usize,
     killers: &KillerMoves,
     history: &HistoryTable,
-) -> Vec<Move> {
-    let mut scored: Vec<(Move, i32)> = moves
-        .iter()
-        .map(|mv| {
-            let score = if tt_move == Some(mv) {
-                1_000_000
-            } else if mv.is_capture() {
-                100_000 + mvv_lva(pos, mv)
-            } else if killers.is_killer(mv, ply) {
-                90_000
-            } else {
-                history.get(mv)
-            };
-            (mv.clone(), score)
-        })
-        .collect();
-    scored.sort_by(|a, b| b.1.cmp(&a.1));
-    scored.into_iter().map(|(mv, _)| mv).collect()
+) -> MoveList {
+    // Sort a stack-allocated copy of the move list in place. This avoids the
+    // two heap vectors (scored tuples + extracted moves) the previous version
+    // built at every node; each score is still computed only once.
+    //
+    // The hash move stays in packed form: comparing packed values is a u16
+    // compare instead of a structural `Move` match, and `NO_MOVE` never
+    // matches because packed moves always have the low bit set.
+    let mut ordered = moves.clone();
+    ordered.sort_by_cached_key(|mv| {
+        let score = if pack_move(mv) == tt_move {
+            1_000_000
+        } else if mv.is_capture() {
+            100_000 + mvv_lva(mv)
+        } else if killers.is_killer(mv, ply) {
+            90_000
+        } else {
+            history.get(mv)
+        };
+        -score
+    });
+    ordered
 }
 
-pub(super) fn mvv_lva(pos: &Chess, mv: &Move) -> i32 {
-    let victim = pos
-        .board()
-        .piece_at(mv.to())
-        .map(|p| role_value(p.role))
-        .unwrap_or(0);
+pub(super) fn mvv_lva(mv: &Move) -> i32 {
+    // The victim role travels on the move itself (including en passant, where
+    // a board lookup at `to` would find an empty square).
+    let victim = mv.capture().map(role_value).unwrap_or(0);
     let attacker = role_value(mv.role());
     victim * 10 - attacker
 }
@@ -8,7 +8,7 @@ use shakmaty::zobrist::ZobristHash;
 use shakmaty::{Chess, Move, Position};
 use std::time::Instant;
 
-use crate::engine::tt::TranspositionTable;
+use crate::engine::tt::{TranspositionTable, unpack_move};
 
 use super::types::{MATE_SCORE, MAX_DEPTH};
 
@@ -31,10 +31,13 @@ pub(super) fn get_pv_from_tt(tt: &TranspositionTable, pos: &Chess, max_ply: usiz
     let mut cur = pos.clone();
     for _ in 0..max_ply {
         let entry = match tt.probe(get_hash(&cur)) {
-            Some(e) if e.best_move.is_some() => e,
-            _ => break,
+            Some(e) => e,
+            None => break,
+        };
+        let mv = match unpack_move(entry.best_move, &cur) {
+            Some(m) => m,
+            None => break,
         };
-        let mv = entry.best_move.unwrap();
         pv.push(mv.clone());
         cur = match cur.play(&mv) {
             Ok(p) => p,
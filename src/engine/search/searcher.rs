@@ -7,8 +7,8 @@ use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
 use std::time::{Duration, Instant};
 
 use crate::engine::book::OpeningBook;
-use crate::engine::eval::{EvalKind, Evaluator};
-use crate::engine::tt::TranspositionTable;
+use crate::engine::eval::{EvalKind, EvalState, Evaluator};
+use crate::engine::tt::{NO_MOVE, PackedTTMove, TranspositionTable, unpack_move};
 
 use super::ordering::{self, HistoryTable, KillerMoves};
 use super::pv::{self, get_hash};
@@ -114,6 +114,21 @@ impl Searcher {
         self.evaluator.evaluate(pos)
     }
 
+    /// Start incremental evaluation at `pos` (see [`Evaluator::begin`]).
+    pub(super) fn eval_begin(&self, pos: &Chess) -> EvalState {
+        self.evaluator.begin(pos)
+    }
+
+    /// Evaluation state after `mv` is played on `pos`.
+    pub(super) fn eval_advance(&self, state: &EvalState, pos: &Chess, mv: &Move) -> EvalState {
+        self.evaluator.advance(state, pos, mv)
+    }
+
+    /// Static evaluation reusing incrementally maintained state.
+    pub(super) fn evaluate_with(&self, pos: &Chess, state: &EvalState) -> i32 {
+        self.evaluator.evaluate_with(pos, state)
+    }
+
     pub fn stop_flag(&self) -> Arc<AtomicBool> {
         self.stop.clone()
     }
@@ -146,7 +161,7 @@ impl Searcher {
                 .global_nodes
                 .as_ref()
                 .map(|gn| gn.load(Ordering::Relaxed))
-                .unwrap_or(self.stats.nodes);
+                .unwrap_or(self.stats.nodes + self.stats.qnodes);
             if nodes >= limit {
                 return true;
             }
@@ -165,7 +180,7 @@ impl Searcher {
         self.global_nodes
             .as_ref()
             .map(|gn| gn.load(Ordering::Relaxed))
-            .unwrap_or(self.stats.nodes)
+            .unwrap_or(self.stats.nodes + self.stats.qnodes)
     }
 
     pub fn calculate_time(&self, limits: &SearchLimits, side: Color) -> Option<Duration> {
@@ -211,12 +226,11 @@ impl Searcher {
 
     pub(super) fn order_moves(
         &self,
-        pos: &Chess,
         moves: &shakmaty::MoveList,
-        tt_move: Option<&Move>,
+        tt_move: PackedTTMove,
         ply: usize,
-    ) -> Vec<Move> {
-        ordering::order_moves(pos, moves, tt_move, ply, &self.killers, &self.history)
+    ) -> shakmaty::MoveList {
+        ordering::order_moves(moves, tt_move, ply, &self.killers, &self.history)
     }
 
     fn probe_book(&self, pos: &Chess) -> Option<Move> {
@@ -358,15 +372,17 @@ impl Searcher {
 
                 best_score = score;
                 let hash = get_hash(pos);
-                if let Some(entry) = self.tt.probe(hash).filter(|e| e.best_move.is_some()) {
-                    best_move = entry.best_move;
+                if let Some(entry) = self.tt.probe(hash)
+                    && let Some(mv) = unpack_move(entry.best_move, pos)
+                {
+                    best_move = Some(mv);
                 }
 
                 let pv = self.get_pv_from_tt(pos, depth as usize + 1);
                 self.report_info(depth, 1, best_score, &pv);
             } else {
                 let legals = pos.legal_moves();
-                let ordered = self.order_moves(pos, &legals, None, 0);
+                let ordered = self.order_moves(&legals, NO_MOVE, 0);
                 let mut root_scores: Vec<(Move, i32)> = Vec::with_capacity(ordered.len());
 
                 for mv in &ordered {
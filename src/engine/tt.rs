@@ -1,7 +1,7 @@
 use std::cell::UnsafeCell;
 use std::sync::atomic::{AtomicU8, Ordering};
 
-use shakmaty::Move;
+use shakmaty::{Chess, Move, Position};
 
 #[derive(Clone, Copy, PartialEq, Eq, Debug)]
 #[repr(u8)]
@@ -11,25 +11,56 @@ pub enum TTFlag {
     UpperBound = 2,
 }
 
-#[derive(Clone)]
+/// TT best move packed into 16 bits, same layout as the opening book
+/// (`from (6) | to (6) | promotion role (3)`), with the low bit set so a real
+/// move never collides with [`NO_MOVE`]. Two bytes instead of the multi-word
+/// `Option<Move>` this used to be, which shrinks every entry and so fits more
+/// of the table in cache.
+pub type PackedTTMove = u16;
+
+/// Sentinel for "no best move stored".
+pub const NO_MOVE: PackedTTMove = 0;
+
+/// Pack a move for TT storage. Castles pack their king and rook squares,
+/// which is enough to match against a legal-move list on decode.
+pub fn pack_move(mv: &Move) -> PackedTTMove {
+    let from = mv.from().map(|s| s as u16).unwrap_or(0);
+    let to = mv.to() as u16;
+    let promo = mv.promotion().map(|r| r as u16).unwrap_or(0);
+    from << 10 | to << 4 | promo << 1 | 1
+}
+
+/// Recover a stored move by matching it against the legal moves of `pos`.
+/// O(moves) — used only on cold paths (PV reconstruction, root best move);
+/// the hot ordering path compares packed values directly.
+pub fn unpack_move(packed: PackedTTMove, pos: &Chess) -> Option<Move> {
+    if packed == NO_MOVE {
+        return None;
+    }
+    pos.legal_moves()
+        .into_iter()
+        .find(|mv| pack_move(mv) == packed)
+}
+
+#[derive(Clone, Copy)]
 pub struct TTEntry {
     pub key: u64,
-    pub best_move: Option<Move>,
     pub depth: i8,
     pub score: i16,
     pub flag: TTFlag,
     pub age: u8,
+    pub best_move: PackedTTMove,
 }
 
 impl TTEntry {
     pub fn empty() -> Self {
         TTEntry {
             key: 0,
-            best_move: None,
             depth: 0,
             score: 0,
             flag: TTFlag::Exact,
             age: 0,
+            best_move: NO_MOVE,
         }
     }
 }
@@ -68,14 +99,10 @@ impl TranspositionTable {
     pub fn probe(&self, key: u64) -> Option<TTEntry> {
         let entries = unsafe { &*self.entries.get() };
         let entry = &entries[self.index(key)];
-        if entry.key == key {
-            Some(entry.clone())
-        } else {
-            None
-        }
+        if entry.key == key { Some(*entry) } else { None }
     }
 
-    pub fn store(&self, key: u64, best_move: Option<Move>, depth: i8, score: i16, flag: TTFlag) {
+    pub fn store(&self, key: u64, best_move: Option<&Move>, depth: i8, score: i16, flag: TTFlag) {
         let age = self.age.load(Ordering::Relaxed);
         let idx = self.index(key);
         let entries = unsafe { &mut *self.entries.get() };
@@ -84,11 +111,11 @@ impl TranspositionTable {
         if should_replace {
             *entry = TTEntry {
                 key,
-                best_move,
                 depth,
                 score,
                 flag,
                 age,
+                best_move: best_move.map(pack_move).unwrap_or(NO_MOVE),
             };
         }
     }
@@ -118,3 +145,30 @@ impl Default for TranspositionTable {
         Self::new(2048)
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn pack_unpack_roundtrip_over_legal_moves() {
+        let pos = Chess::default();
+        for mv in pos.legal_moves() {
+            let packed = pack_move(&mv);
+            assert_ne!(packed, NO_MOVE);
+            assert_eq!(unpack_move(packed, &pos), Some(mv));
+        }
+        assert_eq!(unpack_move(NO_MOVE, &pos), None);
+    }
+
+    #[test]
+    fn store_and_probe_best_move() {
+        let tt = TranspositionTable::new(1);
+        let pos = Chess::default();
+        let mv = pos.legal_moves()[0].clone();
+        tt.store(42, Some(&mv), 5, 100, TTFlag::Exact);
+        let entry = tt.probe(42).unwrap();
+        assert_eq!(entry.best_move, pack_move(&mv));
+        assert_eq!(unpack_move(entry.best_move, &pos), Some(mv));
+    }
+}
@@ -1,5 +1,7 @@
-use shakmaty::{CastlingMode, Chess, Position, fen::Fen, uci::UciMove as SmUciMove};
-use vampirc_uci::{UciFen, UciMove as VampUciMove};
+use shakmaty::{
+    CastlingMode, Chess, File, Position, Rank, Square, fen::Fen, uci::UciMove as SmUciMove,
+};
+use vampirc_uci::{UciFen, UciMove as VampUciMove, UciPiece, UciSquare};
 
 pub(crate) fn parse_uci_move(board: &Chess, move_str: &str) -> Option<shakmaty::Move> {
     let uci: SmUciMove = move_str.parse().ok()?;
@@ -7,17 +9,51 @@ pub(crate) fn parse_uci_move(board: &Chess, move_str: &str) -> Option<shakmaty::
     if board.is_legal(&mv) { Some(mv) } else { None }
 }
 
-/// Applies a vampirc-parsed `position` message (`fen` + `moves` wire types → [`apply_uci_position`]).
+fn vamp_square(sq: &UciSquare) -> Option<Square> {
+    if !(1..=8).contains(&sq.rank) {
+        return None;
+    }
+    let file = File::from_char(sq.file)?;
+    let rank = Rank::new(u32::from(sq.rank) - 1);
+    Some(Square::from_coords(file, rank))
+}
+
+fn vamp_role(piece: UciPiece) -> shakmaty::Role {
+    match piece {
+        UciPiece::Pawn => shakmaty::Role::Pawn,
+        UciPiece::Knight => shakmaty::Role::Knight,
+        UciPiece::Bishop => shakmaty::Role::Bishop,
+        UciPiece::Rook => shakmaty::Role::Rook,
+        UciPiece::Queen => shakmaty::Role::Queen,
+        UciPiece::King => shakmaty::Role::King,
+    }
+}
+
+/// Converts a vampirc wire move straight to a legal [`shakmaty::Move`],
+/// skipping the `to_string` → re-parse detour per move.
+fn vamp_uci_to_move(board: &Chess, mv: &VampUciMove) -> Option<shakmaty::Move> {
+    let uci = SmUciMove::Normal {
+        from: vamp_square(&mv.from)?,
+        to: vamp_square(&mv.to)?,
+        promotion: mv.promotion.map(vamp_role),
+    };
+    let mv = uci.to_move(board).ok()?;
+    if board.is_legal(&mv) { Some(mv) } else { None }
+}
+
+/// Applies a vampirc-parsed `position` message (`fen` + `moves` wire types).
 pub(crate) fn apply_uci_position_from_vampirc(
     board: &mut Chess,
     startpos: bool,
     fen: &Option<UciFen>,
     moves: &[VampUciMove],
 ) {
-    let fen_str = fen.as_ref().map(UciFen::as_str);
-    let move_strs: Vec<String> = moves.iter().map(ToString::to_string).collect();
-    let move_refs: Vec<&str> = move_strs.iter().map(String::as_str).collect();
-    apply_uci_position(board, startpos, fen_str, &move_refs);
+    set_start_position(board, startpos, fen.as_ref().map(UciFen::as_str));
+    for vamp_mv in moves {
+        if let Some(mv) = vamp_uci_to_move(board, vamp_mv) {
+            *board = board.clone().play(&mv).unwrap();
+        }
+    }
 }
 
 fn parse_fen_to_position(fen_str: &str) -> Option<Chess> {
@@ -28,18 +64,21 @@ fn parse_fen_to_position(fen_str: &str) -> Option<Chess> {
         .ok()
 }
 
-pub(crate) fn apply_uci_position(
-    board: &mut Chess,
-    startpos: bool,
-    fen: Option<&str>,
-    move_strs: &[&str],
-) {
+fn set_start_position(board: &mut Chess, startpos: bool, fen: Option<&str>) {
     if startpos {
         *board = Chess::default();
     } else if let Some(pos) = fen.and_then(parse_fen_to_position) {
         *board = pos;
     }
+}
 
+pub(crate) fn apply_uci_position(
+    board: &mut Chess,
+    startpos: bool,
+    fen: Option<&str>,
+    move_strs: &[&str],
+) {
+    set_start_position(board, startpos, fen);
     for &s in move_strs {
         if let Some(mv) = parse_uci_move(board, s) {
             *board = board.clone().play(&mv).unwrap();